@@ -4,139 +4,607 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import collections
+import concurrent.futures
+import ctypes
+import heapq
+import io
+import itertools
+import json
+import os
 import pathlib
-import re
+import sys
 import threading
-from typing import Iterable, Iterator, Sequence
-
+import time
+import xml.sax.saxutils
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    Sequence,
+    TypeVar,
+)
+
+import aiofiles
+import aiohttp
 import edge_tts
+from aiofiles.threadpool.binary import AsyncBufferedIOBase
+from tqdm import tqdm
+
+
+# edge-tts sends at most 4096 bytes of XML-escaped UTF-8 text per request and
+# splits longer text itself, at an arbitrary space. Each request carries its own
+# <speak><voice><prosody> SSML envelope, so fewer, fuller chunks mean fewer
+# handshakes; chunks are also packed against the byte limit so multi-byte
+# punctuation and escapes never push one over it.
+_DEFAULT_MAX_CHARS = 3500
+_MAX_REQUEST_BYTES = 4096
+
+_SENTENCE_PUNCTUATION = ".!?"
 
+# edge-tts returns 48 kbit/s MP3 (6000 bytes per second) and narration runs at
+# roughly 15 characters per second.
+_AUDIO_BYTES_PER_CHAR = 400
+_OUTPUT_BUFFER_SIZE = 1024 * 1024
+# Upper bound on the space reserved up front for a single output file.
+_MAX_PREALLOCATION = 256 * 1024 * 1024
 
-_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_VOICE_CACHE_PATH = pathlib.Path.home() / ".cache" / "audiobook_tool" / "voices.json"
+_VOICE_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
 
+_T = TypeVar("_T")
 
-def chunk_text(text: str, *, max_chars: int = 3000) -> list[str]:
+# Event loop shared by everything the GUI runs in the background; started on first use.
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = threading.Lock()
+
+
+def chunk_text(text: str, *, max_chars: int = _DEFAULT_MAX_CHARS) -> list[str]:
     """Split ``text`` into manageable chunks without cutting sentences in half."""
+    paragraphs = _iter_paragraphs(io.StringIO(text, newline=None))
+    return list(iter_chunks(paragraphs, max_chars=max_chars))
+
+
+def iter_chunks(
+    paragraphs: Iterable[str], *, max_chars: int = _DEFAULT_MAX_CHARS
+) -> Iterator[str]:
+    """Lazily pack stripped, non-empty ``paragraphs`` into chunks of at most ``max_chars``.
+
+    Each chunk is yielded as soon as it is complete, so only the chunk being built
+    is held in memory.
+    """
     if max_chars <= 0:
         raise ValueError("max_chars must be positive")
 
-    stripped = text.strip()
-    if not stripped:
-        return []
+    # Pieces of the chunk being built; joined once when the chunk is flushed so
+    # appending never copies the text accumulated so far. Chunks are bounded both
+    # by max_chars and by the escaped UTF-8 size edge-tts sends per request.
+    current_parts: list[str] = []
+    current_len = 0
+    current_size = 0
 
-    paragraphs = [p.strip() for p in stripped.splitlines() if p.strip()]
+    for paragraph in paragraphs:
+        paragraph_len = len(paragraph)
+        paragraph_size = _request_size(paragraph)
+        if paragraph_len <= max_chars and paragraph_size <= _MAX_REQUEST_BYTES:
+            # Most paragraphs fit in a single request, so skip sentence splitting.
+            if not current_parts:
+                current_parts.append(paragraph)
+                current_len = paragraph_len
+                current_size = paragraph_size
+            elif (
+                current_len + 2 + paragraph_len <= max_chars
+                and current_size + 2 + paragraph_size <= _MAX_REQUEST_BYTES
+            ):
+                current_parts += ("\n\n", paragraph)
+                current_len += 2 + paragraph_len
+                current_size += 2 + paragraph_size
+            else:
+                yield "".join(current_parts)
+                current_parts = [paragraph]
+                current_len = paragraph_len
+                current_size = paragraph_size
+            continue
+
+        prefix, prefix_len = "\n\n", 2
+        for sentence in _split_sentences(paragraph, max_chars=max_chars):
+            sentence_len = len(sentence)
+            sentence_size = _request_size(sentence)
+            if not current_parts:
+                current_parts.append(sentence)
+                current_len = sentence_len
+                current_size = sentence_size
+            elif (
+                current_len + prefix_len + sentence_len <= max_chars
+                and current_size + prefix_len + sentence_size <= _MAX_REQUEST_BYTES
+            ):
+                current_parts += (prefix, sentence)
+                current_len += prefix_len + sentence_len
+                current_size += prefix_len + sentence_size
+            else:
+                yield "".join(current_parts)
+                current_parts = [sentence]
+                current_len = sentence_len
+                current_size = sentence_size
+            prefix, prefix_len = " ", 1
 
-    chunks: list[str] = []
-    current = ""
+    if current_parts:
+        yield "".join(current_parts)
 
-    for paragraph in paragraphs:
-        sentences = (
-            [paragraph]
-            if len(paragraph) <= max_chars
-            else list(_split_sentences(paragraph, max_chars=max_chars))
-        )
 
-        new_paragraph = True
-        for sentence in sentences:
-            if len(sentence) > max_chars:
-                raise ValueError(
-                    "Encountered a sentence longer than max_chars. Increase the limit or shorten the source text."
-                )
+def _request_size(text: str) -> int:
+    return len(xml.sax.saxutils.escape(text).encode("utf-8"))
 
-            prefix = ""
-            if current:
-                prefix = "\n\n" if new_paragraph else " "
 
-            addition = f"{prefix}{sentence}" if prefix else sentence
+def _too_long(text: str, max_chars: int) -> bool:
+    return len(text) > max_chars or _request_size(text) > _MAX_REQUEST_BYTES
 
-            if len(current) + len(addition) <= max_chars:
-                current += addition
-            else:
-                if current:
-                    chunks.append(current)
-                current = sentence
 
-            new_paragraph = False
+def _read_paragraphs(path: pathlib.Path) -> Iterator[str]:
+    """Yield the stripped, non-empty paragraphs of the UTF-8 file at ``path``.
+
+    The file is decoded incrementally and each paragraph is yielded as soon as
+    the blank line ending it has been read, so synthesis can start before the
+    rest of the file is read. This also works for pipes such as ``/dev/stdin``.
+    """
+    with path.open(encoding="utf-8") as source:
+        yield from _iter_paragraphs(source)
 
-    if current:
-        chunks.append(current)
 
-    return chunks
+def _iter_paragraphs(lines: Iterable[str]) -> Iterator[str]:
+    # Paragraphs are separated by blank lines; single line breaks inside a
+    # paragraph (e.g. hard-wrapped text) are left for the speech service.
+    paragraph: list[str] = []
+    for line in lines:
+        if not line.isspace():
+            paragraph.append(line)
+        elif paragraph:
+            yield "".join(paragraph).strip()
+            paragraph.clear()
+    if paragraph:
+        yield "".join(paragraph).strip()
+
+
+def _sentence_breaks(paragraph: str) -> Iterator[tuple[int, int]]:
+    """Yield ``(start, end)`` of every whitespace run that follows ``.``, ``!`` or ``?``.
+
+    Punctuation is located with ``str.find``, which scans in C, and the three
+    marks are merged in position order through a small heap.
+    """
+    length = len(paragraph)
+    heap = [
+        (position, mark)
+        for mark in _SENTENCE_PUNCTUATION
+        if (position := paragraph.find(mark)) >= 0
+    ]
+    heapq.heapify(heap)
+    while heap:
+        position, mark = heap[0]
+        following = paragraph.find(mark, position + 1)
+        if following >= 0:
+            heapq.heapreplace(heap, (following, mark))
+        else:
+            heapq.heappop(heap)
+
+        end = position + 1
+        if end < length and paragraph[end].isspace():
+            while end < length and paragraph[end].isspace():
+                end += 1
+            yield position + 1, end
 
 
 def _split_sentences(paragraph: str, *, max_chars: int) -> Iterator[str]:
+    # Sentence breaks cover all whitespace between sentences, so each sentence is
+    # a single slice; only the ends of the paragraph itself need trimming.
     start = 0
-    for match in _SENTENCE_END.finditer(paragraph):
-        sentence = paragraph[start : match.start()].strip()
-        if sentence:
-            if len(sentence) > max_chars:
-                raise ValueError(
-                    "Found a sentence longer than max_chars. Increase max_chars or edit the sentence."
-                )
+    end = len(paragraph)
+    while start < end and paragraph[start].isspace():
+        start += 1
+    while end > start and paragraph[end - 1].isspace():
+        end -= 1
+
+    for break_start, break_end in _sentence_breaks(paragraph):
+        if break_start >= end:
+            break
+        sentence = paragraph[start:break_start]
+        if _too_long(sentence, max_chars):
+            yield from _split_lines(sentence, max_chars=max_chars)
+        else:
+            yield sentence
+        start = break_end
+    if start < end:
+        sentence = paragraph[start:end]
+        if _too_long(sentence, max_chars):
+            yield from _split_lines(sentence, max_chars=max_chars)
+        else:
             yield sentence
-        start = match.end()
-    tail = paragraph[start:].strip()
-    if tail:
-        if len(tail) > max_chars:
-            raise ValueError(
-                "Found a sentence longer than max_chars. Increase max_chars or edit the sentence."
-            )
-        yield tail
 
 
-async def synthesize_chunks(
+def _split_lines(sentence: str, *, max_chars: int) -> Iterator[str]:
+    # Headings, verse and lists rarely end in punctuation, so an oversized
+    # "sentence" is usually several lines that can be read one by one.
+    for line in sentence.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        if _too_long(line, max_chars):
+            yield from _split_long_line(line, max_chars=max_chars)
+        else:
+            yield line
+
+
+def _split_long_line(line: str, *, max_chars: int) -> Iterator[str]:
+    # Last resort for a line with no sentence or line break in reach: cut it at
+    # the last whitespace that fits, or mid-word when a single word is too long.
+    while _too_long(line, max_chars):
+        limit = _fitting_length(line, max_chars)
+        cut = limit
+        while cut > 0 and not line[cut].isspace():
+            cut -= 1
+        if cut == 0:
+            cut = limit
+        yield line[:cut].rstrip()
+        line = line[cut:].lstrip()
+    if line:
+        yield line
+
+
+def _fitting_length(line: str, max_chars: int) -> int:
+    """Return the length of the longest prefix of ``line`` that fits in one request."""
+    size = 0
+    for index, char in enumerate(itertools.islice(line, max_chars)):
+        size += _request_size(char)
+        if size > _MAX_REQUEST_BYTES:
+            return index
+    return min(len(line), max_chars)
+
+
+class _SharedConnector(aiohttp.TCPConnector):
+    """TCP connector that outlives the per-request sessions opened by edge-tts.
+
+    ``edge_tts.Communicate`` wraps every request in its own ``aiohttp.ClientSession``,
+    which closes the connector it is given on exit. Ignoring those calls lets all
+    chunks share one connector (and its DNS cache); :meth:`aclose` releases it.
+
+    This relies on edge-tts opening one session per request with the default
+    ``connector_owner=True``; if it ever keeps a session open across requests,
+    this class is no longer needed.
+    """
+
+    def close(self, *args: object, **kwargs: object) -> Awaitable[None]:
+        return asyncio.sleep(0)
+
+    async def aclose(self) -> None:
+        await super().close()
+
+
+async def _synthesize_chunk(
+    chunk: str,
+    *,
+    voice: str,
+    rate: str,
+    pitch: str,
+    connector: aiohttp.BaseConnector,
+    semaphore: asyncio.Semaphore,
+) -> bytes:
+    """Synthesize a single chunk into memory, holding ``semaphore`` while streaming."""
+    audio = bytearray()
+    async with semaphore:
+        communicate = edge_tts.Communicate(
+            chunk, voice=voice, rate=rate, pitch=pitch, connector=connector
+        )
+        async for data in communicate.stream():
+            if data["type"] == "audio":
+                audio.extend(data["data"])
+    return bytes(audio)
+
+
+async def _pump_audio(
+    communicate: edge_tts.Communicate, pieces: asyncio.Queue[bytes | None]
+) -> None:
+    """Push the audio from ``communicate`` into ``pieces`` as it arrives."""
+    try:
+        async for data in communicate.stream():
+            if data["type"] == "audio":
+                pieces.put_nowait(data["data"])
+    finally:
+        pieces.put_nowait(None)
+
+
+async def _stream_chunks(
+    text_chunks: Iterable[str],
+    *,
+    voice: str,
+    rate: str,
+    pitch: str,
+    connector: aiohttp.BaseConnector,
+    concurrency: int,
+    progress: Callable[[int], None] | None,
+) -> None:
+    """Write the audio for ``text_chunks`` to standard output as soon as it arrives.
+
+    While one chunk is being written, the requests for up to ``concurrency - 1``
+    following chunks are already open and buffering, so the handshake for the
+    next chunk is over by the time the current one ends.
+    """
+    stdout = aiofiles.stdout_bytes
+    chunks = iter(text_chunks)
+    # (live audio pieces, synthesis task) per chunk, in chunk order.
+    streams: collections.deque[
+        tuple[asyncio.Queue[bytes | None], asyncio.Task[None]]
+    ] = collections.deque()
+
+    def start(chunk: str) -> tuple[asyncio.Queue[bytes | None], asyncio.Task[None]]:
+        pieces: asyncio.Queue[bytes | None] = asyncio.Queue()
+        communicate = edge_tts.Communicate(
+            chunk, voice=voice, rate=rate, pitch=pitch, connector=connector
+        )
+        return pieces, asyncio.create_task(_pump_audio(communicate, pieces))
+
+    index = 0
+    try:
+        while True:
+            while len(streams) < concurrency and (chunk := next(chunks, None)) is not None:
+                streams.append(start(chunk))
+            if not streams:
+                break
+
+            pieces, task = streams[0]
+            while (piece := await pieces.get()) is not None:
+                await stdout.write(piece)
+                await stdout.flush()
+            await task  # Surface any error from the request.
+            streams.popleft()
+
+            index += 1
+            if progress is not None:
+                progress(index)
+    finally:
+        for _, task in streams:
+            task.cancel()
+
+
+async def _write_chunks(
     text_chunks: Iterable[str],
     *,
     voice: str,
     output_path: pathlib.Path,
     rate: str,
     pitch: str,
+    connector: aiohttp.BaseConnector,
+    concurrency: int,
+    expected_chars: int | None,
+    progress: Callable[[int], None] | None,
 ) -> None:
-    """Generate speech for ``text_chunks`` and append the audio to ``output_path``."""
+    """Synthesize up to ``concurrency`` chunks at once and write them in order."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    if output_path.exists():
-        output_path.unlink()
 
-    with output_path.open("ab") as output_file:
-        for index, chunk in enumerate(text_chunks, start=1):
-            communicate = edge_tts.Communicate(chunk, voice=voice, rate=rate, pitch=pitch)
-            async for data in communicate.stream():
-                if data["type"] == "audio":
-                    output_file.write(data["data"])
-            output_file.flush()
-            print(f"Finished chunk {index}")
+    semaphore = asyncio.Semaphore(concurrency)
+    # Synthesis tasks in chunk order. The bound keeps the producer only a few
+    # chunks ahead of the writer so finished audio does not pile up in memory.
+    queue: asyncio.Queue[asyncio.Task[bytes] | None] = asyncio.Queue(maxsize=concurrency)
+
+    async def produce() -> None:
+        for chunk in text_chunks:
+            task = asyncio.create_task(
+                _synthesize_chunk(
+                    chunk,
+                    voice=voice,
+                    rate=rate,
+                    pitch=pitch,
+                    connector=connector,
+                    semaphore=semaphore,
+                )
+            )
+            try:
+                await queue.put(task)
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+        await queue.put(None)
+
+    async def consume(output_file: AsyncBufferedIOBase) -> None:
+        if reservation is not None:
+            await asyncio.shield(reservation)
+        index = 0
+        while (task := await queue.get()) is not None:
+            audio = await task
+            await output_file.write(audio)
+            index += 1
+            if progress is not None:
+                progress(index)
+
+    # aiofiles runs the blocking file calls in a thread pool, so slow storage never
+    # stalls the event loop (and with it the websocket reads).
+    async with aiofiles.open(output_path, "wb", buffering=_OUTPUT_BUFFER_SIZE) as output_file:
+        producer = asyncio.create_task(produce())
+        # Reserve space while the first requests are already in flight. The writer
+        # waits for it, and it is shielded so the truncate below never races it.
+        reservation = (
+            asyncio.create_task(
+                asyncio.to_thread(
+                    _preallocate,
+                    output_file.fileno(),
+                    min(expected_chars * _AUDIO_BYTES_PER_CHAR, _MAX_PREALLOCATION),
+                )
+            )
+            if expected_chars
+            else None
+        )
+        consumer = asyncio.create_task(consume(output_file))
+        try:
+            await asyncio.gather(producer, consumer)
+        finally:
+            producer.cancel()
+            consumer.cancel()
+            while not queue.empty():
+                task = queue.get_nowait()
+                if task is not None:
+                    task.cancel()
+            if reservation is not None:
+                await reservation
+            # Release the unused part of the reservation, also when the run failed
+            # part-way, so no zero-filled tail is left behind.
+            await output_file.truncate()
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve ``size`` bytes for the file ``fd`` where the filesystem does it natively.
+
+    glibc's ``posix_fallocate`` emulates missing filesystem support (vfat, NFS
+    before 4.2) by writing to every block, which holds up the writer for seconds
+    on exactly the slow media the reservation is meant for. On Linux the raw
+    ``fallocate`` call is used instead; it fails there and the file simply grows
+    as it is written.
+    """
+    if sys.platform.startswith("linux"):
+        fallocate = _native_fallocate()
+        if fallocate is not None:
+            fallocate(fd, 0, 0, size)  # Returns -1 without native support.
+        return
+    if not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        pass  # Preallocation is only a hint; the file still grows as needed.
+
+
+def _native_fallocate() -> Callable[..., int] | None:
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+    # fallocate64 takes 64-bit offsets on every architecture, plain fallocate
+    # only on 64-bit ones.
+    fallocate = getattr(libc, "fallocate64", None)
+    if fallocate is None and ctypes.sizeof(ctypes.c_long) == 8:
+        fallocate = getattr(libc, "fallocate", None)
+    if fallocate is not None:
+        fallocate.argtypes = (ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64)
+        fallocate.restype = ctypes.c_int
+    return fallocate
+
+
+async def synthesize_chunks(
+    text_chunks: Iterable[str],
+    *,
+    voice: str,
+    output_path: pathlib.Path | None,
+    rate: str,
+    pitch: str,
+    concurrency: int = 4,
+    expected_chars: int | None = None,
+    progress: Callable[[int], None] | None = None,
+) -> None:
+    """Generate speech for ``text_chunks`` and write the audio to ``output_path``.
+
+    Up to ``concurrency`` chunks are synthesized at once while a separate task
+    writes the finished audio to disk in chunk order. ``expected_chars`` is the
+    approximate length of the text and is used to preallocate the output file.
+    When ``output_path`` is ``None`` the audio is streamed to standard output as
+    it arrives instead, with the following chunks requested ahead. ``progress``
+    is called with the 1-based index of every chunk once its audio has been
+    written.
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+
+    # Resolve the service host every few minutes instead of once per chunk, so a
+    # long book still follows the CDN if it moves the service to another address.
+    connector = _SharedConnector(ttl_dns_cache=300)
+    try:
+        if output_path is None:
+            await _stream_chunks(
+                text_chunks,
+                voice=voice,
+                rate=rate,
+                pitch=pitch,
+                connector=connector,
+                concurrency=concurrency,
+                progress=progress,
+            )
+        else:
+            await _write_chunks(
+                text_chunks,
+                voice=voice,
+                output_path=output_path,
+                rate=rate,
+                pitch=pitch,
+                connector=connector,
+                concurrency=concurrency,
+                expected_chars=expected_chars,
+                progress=progress,
+            )
+    finally:
+        await connector.aclose()
 
 
 async def create_audiobook(
     input_path: pathlib.Path,
-    output_path: pathlib.Path,
+    output_path: pathlib.Path | None,
     *,
     voice: str,
     rate: str,
     pitch: str,
     max_chars: int,
+    concurrency: int = 4,
+    progress: Callable[[int], None] | None = None,
 ) -> None:
-    text = input_path.read_text(encoding="utf-8")
-    chunks = chunk_text(text, max_chars=max_chars)
-    if not chunks:
-        raise SystemExit("Input file does not contain any readable text")
-    print(f"Generating audiobook with {len(chunks)} chunk(s)...")
+    chunks = iter_chunks(_read_paragraphs(input_path), max_chars=max_chars)
+    first_chunk = next(chunks, None)
+    if first_chunk is None:
+        raise ValueError("Input file does not contain any readable text")
     await synthesize_chunks(
-        chunks,
+        itertools.chain([first_chunk], chunks),
         voice=voice,
         output_path=output_path,
         rate=rate,
         pitch=pitch,
+        concurrency=concurrency,
+        # The UTF-8 size is close enough to the character count for preallocation.
+        expected_chars=input_path.stat().st_size,
+        progress=progress,
     )
-    print(f"Saved audiobook to {output_path}")
 
 
 async def _list_available_voices() -> list[str]:
-    """Return the available neural voice short names, sorted alphabetically."""
+    """Return the available neural voice short names, sorted alphabetically.
+
+    The list changes rarely, so it is cached on disk for a week.
+    """
+
+    cached = _read_voice_cache()
+    if cached:
+        return cached
 
     voices_manager = await edge_tts.VoicesManager.create()
-    voices = {voice["ShortName"] for voice in voices_manager.voices}
-    return sorted(voices)
+    voices = sorted({voice["ShortName"] for voice in voices_manager.voices})
+    _write_voice_cache(voices)
+    return voices
+
+
+def _read_voice_cache() -> list[str] | None:
+    try:
+        if time.time() - _VOICE_CACHE_PATH.stat().st_mtime > _VOICE_CACHE_MAX_AGE:
+            return None
+        voices = json.loads(_VOICE_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(voices, list) or not all(isinstance(voice, str) for voice in voices):
+        return None
+    return voices
+
+
+def _write_voice_cache(voices: Sequence[str]) -> None:
+    try:
+        _VOICE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _VOICE_CACHE_PATH.write_text(json.dumps(list(voices)), encoding="utf-8")
+    except OSError:
+        pass  # The cache is only an optimization.
 
 
 def _default_voice(voices: Sequence[str]) -> str:
@@ -146,6 +614,16 @@ def _default_voice(voices: Sequence[str]) -> str:
     return voices[0] if voices else "en-US-JennyNeural"
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -176,9 +654,20 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--max-chars",
-        type=int,
-        default=3000,
-        help="Maximum characters per request to the speech service",
+        type=_positive_int,
+        default=_DEFAULT_MAX_CHARS,
+        help=f"Maximum characters per request to the speech service (default: {_DEFAULT_MAX_CHARS})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=4,
+        help="Number of chunks to synthesize at the same time (default: 4)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write the MP3 audio to standard output as it is generated instead of saving a file.",
     )
     parser.add_argument(
         "--gui",
@@ -197,16 +686,43 @@ def main() -> None:
     if not args.input.exists():
         raise SystemExit(f"Input file '{args.input}' does not exist")
 
-    asyncio.run(
-        create_audiobook(
-            args.input,
-            args.output,
-            voice=args.voice,
-            rate=args.rate,
-            pitch=args.pitch,
-            max_chars=args.max_chars,
-        )
-    )
+    output_path = None if args.stream else args.output
+    # The bar goes to stderr, so it does not mix with audio streamed to stdout.
+    with tqdm(desc="Generating audiobook", unit=" chunks") as progress_bar:
+        try:
+            asyncio.run(
+                create_audiobook(
+                    args.input,
+                    output_path,
+                    voice=args.voice,
+                    rate=args.rate,
+                    pitch=args.pitch,
+                    max_chars=args.max_chars,
+                    concurrency=args.concurrency,
+                    progress=lambda _index: progress_bar.update(),
+                )
+            )
+        except ValueError as error:
+            raise SystemExit(str(error)) from error
+    if output_path is not None:
+        print(f"Saved audiobook to {output_path}")
+
+
+def _submit(coro: Coroutine[Any, Any, _T]) -> concurrent.futures.Future[_T]:
+    """Schedule ``coro`` on the shared background event loop.
+
+    Reusing one loop avoids paying for a new loop (and its resolver and selector)
+    on every ``asyncio.run`` call.
+    """
+    global _background_loop
+
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever, name="audiobook-event-loop", daemon=True
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop)
 
 
 def launch_gui() -> None:
@@ -227,22 +743,30 @@ def launch_gui() -> None:
     voice_var = tk.StringVar()
     rate_var = tk.StringVar(value="+0%")
     pitch_var = tk.StringVar(value="+0Hz")
-    max_chars_var = tk.StringVar(value="3000")
+    max_chars_var = tk.StringVar(value=str(_DEFAULT_MAX_CHARS))
+
+    # Load the voices in the background so the window appears immediately; the
+    # default voice is usable until the full list arrives.
+    voices_future = _submit(_list_available_voices())
 
-    def load_voices() -> list[str]:
+    def poll_voices() -> None:
+        if not voices_future.done():
+            root.after(100, poll_voices)
+            return
         try:
-            return asyncio.run(_list_available_voices())
+            loaded_voices = voices_future.result()
         except Exception as error:  # pragma: no cover - depends on remote service
             messagebox.showwarning(
                 "Voice Download Failed",
                 "Unable to download the list of voices. Using the default voice instead.\n"
                 f"Details: {error}",
             )
-            return ["en-US-JennyNeural"]
+            return
+        if loaded_voices:
+            voice_combo.configure(values=loaded_voices)
+            voice_var.set(_default_voice(loaded_voices))
 
-    voices = load_voices()
-    if not voices:
-        voices = ["en-US-JennyNeural"]
+    voices = ["en-US-JennyNeural"]
     voice_var.set(_default_voice(voices))
 
     rate_options = [
@@ -321,7 +845,7 @@ def launch_gui() -> None:
 
         def worker() -> None:
             try:
-                asyncio.run(
+                _submit(
                     create_audiobook(
                         input_path,
                         output_path,
@@ -329,8 +853,11 @@ def launch_gui() -> None:
                         rate=rate_var.get(),
                         pitch=pitch_var.get(),
                         max_chars=int(max_chars_var.get()),
+                        progress=lambda index: root.after(
+                            0, lambda: status_var.set(f"Generated chunk {index}...")
+                        ),
                     )
-                )
+                ).result()
             except Exception as error:  # pragma: no cover - GUI feedback
                 root.after(
                     0,
@@ -405,6 +932,7 @@ def launch_gui() -> None:
     main_frame.columnconfigure(0, weight=1)
     main_frame.columnconfigure(1, weight=1)
 
+    poll_voices()
     root.mainloop()
 
 